@@ -4,18 +4,19 @@ from werkzeug.security import generate_password_hash, check_password_hash
 import pandas as pd
 import numpy as np
 import pickle
+import joblib
 import os
-import json
+import atexit
+import threading
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 import logging
 from logging.handlers import RotatingFileHandler
 import plotly.express as px
 import plotly.graph_objects as go
-import plotly.utils
-from io import BytesIO
-import base64
-import matplotlib.pyplot as plt
-import seaborn as sns
+import plotly.io as pio
 
 app = Flask(__name__, template_folder='../templates')
 
@@ -45,12 +46,15 @@ login_manager.init_app(app)
 login_manager.login_view = 'login'
 
 # Dataset helpers
-DATASET_PATH = os.path.join(DATA_DIR, 'StudentPerformance_with_names.csv')
+DATASET_PATH = os.path.join(DATA_DIR, 'StudentPerformance_with_names.parquet')
+DATASET_CSV_PATH = os.path.join(DATA_DIR, 'StudentPerformance_with_names.csv')
 
-def load_dataset(csv_path: str) -> pd.DataFrame:
-    """Load and sanitize the dataset: fix column names, dtypes, and basic issues."""
-    df_local = pd.read_csv(csv_path)
+def read_csv_dataset(csv_path: str) -> pd.DataFrame:
+    """Load and sanitize the CSV dataset: fix column names, dtypes, and basic issues."""
+    return sanitize_dataset(pd.read_csv(csv_path))
 
+def sanitize_dataset(df_local: pd.DataFrame) -> pd.DataFrame:
+    """Fix column names, dtypes, and basic issues; a no-op on an already sanitized frame."""
     # Standardize column names: strip whitespace
     df_local.columns = [str(c).strip() for c in df_local.columns]
 
@@ -85,146 +89,338 @@ def load_dataset(csv_path: str) -> pd.DataFrame:
 
     return df_local
 
-# Load the dataset
-df = load_dataset(DATASET_PATH)
+def save_dataset(frame: pd.DataFrame, path: str = DATASET_PATH) -> None:
+    """Persist the dataset as snappy-compressed Parquet (dictionary-encoded strings).
+    Written to a temporary file and moved into place, so an interrupted write never tears the live file.
+    """
+    tmp_path = path + '.tmp'
+    try:
+        frame.to_parquet(tmp_path, engine='pyarrow', compression='snappy', index=False)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def load_dataset(parquet_path: str, csv_path: str) -> pd.DataFrame:
+    """Load the Parquet dataset, migrating it once from the CSV when it does not exist yet.
+    Parquet input is sanitized too, since it may come from the data scripts rather than save_dataset.
+    An unreadable Parquet file is reported and the dataset is re-seeded from the CSV.
+    """
+    if os.path.exists(parquet_path):
+        try:
+            return sanitize_dataset(pd.read_parquet(parquet_path, engine='pyarrow'))
+        except Exception as e:
+            app.logger.error(f"Could not read {parquet_path} ({e}); falling back to {csv_path}")
+
+    df_local = read_csv_dataset(csv_path)
+    try:
+        save_dataset(df_local, parquet_path)
+        app.logger.info(f"Migrated dataset to Parquet at {parquet_path}")
+    except Exception as e:
+        app.logger.warning(f"Parquet migration failed ({e}); continuing with CSV data")
+    return df_local
+
+# Mark updates are persisted by a debounced background writer so requests never wait on disk I/O
+SAVE_DELAY_SECONDS = 1.0
+_dataset_lock = threading.Lock()  # guards df mutations and the dirty/timer state
+_flush_lock = threading.Lock()    # serializes writers so snapshots reach disk in order
+_dataset_dirty = False
+_save_timer = None
+# Bumped by mark_dataset_changed(); part of every cache key, so results computed from
+# data that has since changed can never be served after the update
+_dataset_version = 0
+
+def flush_dataset(retry: bool = True) -> None:
+    """Write a snapshot of df to disk if there are unsaved updates.
+    A failed write keeps df dirty; it is retried later, or re-raised when retry is False (shutdown).
+    """
+    global _dataset_dirty, _save_timer
+    with _flush_lock:
+        with _dataset_lock:
+            if not _dataset_dirty:
+                return
+            _dataset_dirty = False
+            _save_timer = None
+            snapshot = df.copy()
+        try:
+            save_dataset(snapshot)
+        except Exception as e:
+            app.logger.error(f"Failed saving dataset updates: {e}")
+            with _dataset_lock:
+                if retry:
+                    schedule_dataset_save()
+                else:
+                    _dataset_dirty = True
+            if not retry:
+                raise
+
+def schedule_dataset_save() -> None:
+    """Mark df as dirty; updates within SAVE_DELAY_SECONDS are coalesced into one write.
+    Call while holding _dataset_lock.
+    """
+    global _dataset_dirty, _save_timer
+    _dataset_dirty = True
+    if _save_timer is None:
+        _save_timer = threading.Timer(SAVE_DELAY_SECONDS, flush_dataset)
+        _save_timer.daemon = True
+        _save_timer.start()
+
+# Flush any pending updates on shutdown
+atexit.register(flush_dataset, retry=False)
+
+# Load the dataset, indexed by student_id for O(1) per-student lookups
+df = load_dataset(DATASET_PATH, DATASET_CSV_PATH)
+df.set_index('student_id', inplace=True, drop=False)
+# Unnamed index so 'student_id' stays unambiguous as a column label
+df.index.name = None
+
+def find_student(student_id):
+    """Return the dataset row for student_id, or None if the id is unknown."""
+    try:
+        return df.loc[[student_id]].iloc[0]
+    except KeyError:
+        return None
+
+# Model feature layout: 7 numerical columns followed by 13 encoded categorical columns
+NUMERIC_FEATURES = [
+    'age', 'Attendance', 'Hours_Studied', 'Previous_Scores', 'Sleep_Hours',
+    'Physical_Activity', 'Tutoring_Sessions'
+]
+CATEGORICAL_MAPPING = MappingProxyType({
+    'Gender': {'Male': 0, 'Female': 1},
+    'Teacher_Feedback': {'Low': 0, 'Medium': 1, 'High': 2},
+    'Parental_Involvement': {'Low': 0, 'Medium': 1, 'High': 2},
+    'Access_to_Resources': {'Low': 0, 'Medium': 1, 'High': 2},
+    'Extracurricular_Activities': {'No': 0, 'Yes': 1},
+    'Physical_Activity.1': {'Low': 0, 'Medium': 1, 'High': 2},
+    'Internet_Access': {'No': 0, 'Yes': 1},
+    'Family_Income': {'Low': 0, 'Medium': 1, 'High': 2},
+    'School_Type': {'Public': 0, 'Private': 1},
+    'Peer_Influence': {'Negative': 0, 'Neutral': 1, 'Positive': 2},
+    'Learning_Disabilities': {'No': 0, 'Yes': 1},
+    'Parental_Education_Level': {'High School': 0, 'College': 1, 'Postgraduate': 2},
+    'Distance_from_Home': {'Near': 0, 'Moderate': 1, 'Far': 2}
+})
+FEATURE_COLUMNS = NUMERIC_FEATURES + list(CATEGORICAL_MAPPING)
+# (column, categories ordered by code) pairs in feature order
+_CAT_ORDER = tuple(
+    (col, tuple(sorted(mapping, key=mapping.get))) for col, mapping in CATEGORICAL_MAPPING.items()
+)
+
+def build_feature_matrix(frame: pd.DataFrame) -> np.ndarray:
+    """Encode every dataset row into the model's feature layout (one row per student).
+    Categorical codes follow CATEGORICAL_MAPPING; unknown or missing values encode as 0.
+    """
+    columns = [frame[col].fillna(0).to_numpy(dtype=np.float32) for col in NUMERIC_FEATURES]
+    for col, categories in _CAT_ORDER:
+        if col in frame.columns:
+            # Categories are ordered by mapped value, so .codes equals the mapping
+            codes = pd.Categorical(frame[col], categories=categories).codes
+            columns.append(np.where(codes < 0, 0, codes))
+        else:
+            columns.append(np.zeros(len(frame)))
+    return np.column_stack(columns).astype(np.float32)
+
+def performance_labels(frame: pd.DataFrame) -> np.ndarray:
+    """Derive the Low/Medium/High training target from mean attendance and previous score.
+    Same buckets as pd.cut(bins=[0, 60, 80, 100]); averages outside (0, 100] become 'Medium'.
+    """
+    avg = ((frame['Attendance'] + frame['Previous_Scores']) / 2).to_numpy()
+    return np.select(
+        [(avg > 0) & (avg <= 60), (avg > 60) & (avg <= 80), (avg > 80) & (avg <= 100)],
+        ['Low', 'Medium', 'High'],
+        default='Medium'
+    )
+
+FEATURE_MATRIX = build_feature_matrix(df)
 
 # Load teachers dataset (for admin analytics/user management)
 try:
-    teachers_df = pd.read_csv(os.path.join(DATA_DIR, 'teachers.csv'))
+    # Arrow-backed string columns keep the status comparison in pyarrow compute kernels
+    teachers_df = pd.read_csv(os.path.join(DATA_DIR, 'teachers.csv'), engine='pyarrow', dtype_backend='pyarrow')
     # Normalize columns
     teachers_df.columns = [c.strip().lower() for c in teachers_df.columns]
 except Exception:
     teachers_df = pd.DataFrame(columns=['username', 'name', 'role', 'subject', 'status'])
 
-# Load the trained model
+# Model files: the pickle is the source of truth; the uncompressed joblib copy can be memory-mapped
+MODEL_PATH = os.path.join(MODELS_DIR, 'random_forest_student_performance_model.pkl')
+MODEL_JOBLIB_PATH = os.path.join(MODELS_DIR, 'random_forest_student_performance_model.joblib')
+
+def save_model_joblib(model_obj) -> None:
+    """Write the uncompressed joblib copy of the model (compression would prevent mmap).
+    The copy is written to a temporary file and moved into place so other workers never read a partial file.
+    """
+    tmp_path = f"{MODEL_JOBLIB_PATH}.{os.getpid()}.tmp"
+    try:
+        joblib.dump(model_obj, tmp_path, compress=0)
+        os.replace(tmp_path, MODEL_JOBLIB_PATH)
+    except Exception as e:
+        app.logger.warning(f"Could not write joblib model copy ({e}); pickle loading will be used")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def load_model():
+    """Load the model from the joblib copy when it is up to date, otherwise (or if it fails) from the pickle"""
+    if os.path.exists(MODEL_JOBLIB_PATH) and os.path.getmtime(MODEL_JOBLIB_PATH) >= os.path.getmtime(MODEL_PATH):
+        try:
+            # Memory-mapped read of the uncompressed copy; sklearn copies the tree arrays into
+            # per-process buffers on unpickling, so this speeds up loading but shares no memory
+            return joblib.load(MODEL_JOBLIB_PATH, mmap_mode='r')
+        except Exception as e:
+            app.logger.warning(f"Joblib model copy unreadable ({e}); loading the pickle instead")
+    with open(MODEL_PATH, 'rb') as f:
+        model_obj = pickle.load(f)
+    save_model_joblib(model_obj)
+    return model_obj
+
+# Load the trained model; only retrain when the pickle itself cannot be loaded
 try:
-    with open(os.path.join(MODELS_DIR, 'random_forest_student_performance_model.pkl'), 'rb') as f:
-        model = pickle.load(f)
+    model = load_model()
     app.logger.info("Loaded pre-trained model successfully")
 except Exception as e:
     app.logger.warning(f"Model load failed ({e}); creating a new model compatible with current feature set...")
     # If model file doesn't exist or is incompatible, create a new one for demo
     from sklearn.ensemble import RandomForestClassifier
-    from sklearn.preprocessing import LabelEncoder
-    
-    # Prepare data for training
-    le = LabelEncoder()
-    df_encoded = df.copy()
-    
-    # Encode categorical variables
-    categorical_columns = ['Gender', 'Teacher_Feedback', 'Parental_Involvement', 'Access_to_Resources', 
-                          'Extracurricular_Activities', 'Physical_Activity.1', 'Internet_Access', 
-                          'Family_Income', 'School_Type', 'Peer_Influence', 'Learning_Disabilities', 
-                          'Parental_Education_Level', 'Distance_from_Home']
-    
-    for col in categorical_columns:
-        if col in df_encoded.columns:
-            df_encoded[col] = le.fit_transform(df_encoded[col].astype(str))
-    
-    # Create target variable (performance category based on attendance and previous scores)
-    df_encoded['Performance'] = pd.cut(
-        (df_encoded['Attendance'] + df_encoded['Previous_Scores']) / 2,
-        bins=[0, 60, 80, 100],
-        labels=['Low', 'Medium', 'High']
-    )
-    
-    # Prepare features - exactly matching what prepare_features function will use
-    feature_columns = ['age', 'Attendance', 'Hours_Studied', 'Previous_Scores', 'Sleep_Hours', 
-                      'Physical_Activity', 'Tutoring_Sessions']
-    feature_columns.extend(categorical_columns)
     
-    X = df_encoded[feature_columns].fillna(0)
-    y = df_encoded['Performance'].fillna('Medium')
+    # Training data reuses the encoded feature matrix used for predictions
+    X = FEATURE_MATRIX
+    y = performance_labels(df)
     
-    # Train model
-    model = RandomForestClassifier(n_estimators=100, random_state=42)
+    # Train model; the out-of-bag score gives the admin accuracy metric without refitting
+    model = RandomForestClassifier(n_estimators=100, random_state=42, bootstrap=True, oob_score=True, n_jobs=-1)
     model.fit(X, y)
     
     # Save model
-    with open(os.path.join(MODELS_DIR, 'random_forest_student_performance_model.pkl'), 'wb') as f:
+    with open(MODEL_PATH, 'wb') as f:
         pickle.dump(model, f)
-    app.logger.info(f"Created new model with {len(feature_columns)} features")
+    save_model_joblib(model)
+    app.logger.info(f"Created new model with {len(FEATURE_COLUMNS)} features")
+
+@lru_cache(maxsize=1)
+def compute_admin_metrics():
+    """Compute model accuracy, data quality and student coverage for the admin dashboard.
+    Computed on the first admin request and cached; returns (None, None, None) if the metrics fail.
+    """
+    try:
+        from sklearn.model_selection import cross_val_score
+        
+        oob_score = getattr(model, 'oob_score_', None)
+        if oob_score is not None:
+            # Out-of-bag estimate recorded at training time (pickled with the model)
+            model_accuracy = oob_score * 100
+        else:
+            # Reuse the encoded feature matrix and derive the target in NumPy
+            X = FEATURE_MATRIX
+            y = performance_labels(df)
+            
+            # Calculate cross-validation accuracy; single-threaded so concurrent workers don't oversubscribe the CPU
+            cv_scores = cross_val_score(model, X, y, cv=5, scoring='accuracy', n_jobs=1)
+            model_accuracy = cv_scores.mean() * 100
+        
+        # Calculate data quality (percentage of non-null values)
+        total_cells = df.size
+        non_null_cells = df.count().sum()
+        data_quality = round((non_null_cells / total_cells) * 100, 1)
+        
+        # Calculate student coverage (percentage of students with complete data)
+        complete_records = df.dropna().shape[0]
+        student_coverage = round((complete_records / len(df)) * 100, 1)
+        
+        return model_accuracy, data_quality, student_coverage
+    except Exception as e:
+        app.logger.warning(f"Error calculating admin metrics: {e}")
+        return None, None, None
+
+# Precomputed demo password hashes (werkzeug generate_password_hash) so importing the app
+# does not run the key-derivation function once per demo account
+DEMO_ADMIN_PASSWORD_HASH = 'scrypt:32768:8:1$p0lOfv3MhwrHL57A$a51651bbda8abf3eb050a8963c445755a5b07792a4bc32bb8e57cc8e2f4a72aa91b78163dc462fe19413de0189a54756519a8a0d7f194670fd8ab5f46dc1ade6'  # admin123
+DEMO_TEACHER_PASSWORD_HASH = 'scrypt:32768:8:1$AzQY5J6bAogHobH3$08de544449daccc4db117669d43812e6770f4033dea052c38e328c55f99cecc1be11c2a4fdb1d256f9e30e8fffc3aae6ae9b6488c3c7bf73d91305ab21279540'  # teacher123
+DEMO_STUDENT_PASSWORD_HASH = 'scrypt:32768:8:1$4CA1eA9q6pPgmC3S$7921563bd0b97c9ba707ff199ccc5419d7b555bbe1d63f31ac38897850d1c8b2f2174e80600a82e0888abed3e33c1250662c6a7aae9a19cea07aad7d2fc0a716'  # student123
 
 # User management (in-memory for demo)
 users = {
     'admin': {
         'username': 'admin',
-        'password': generate_password_hash('admin123'),
+        'password': DEMO_ADMIN_PASSWORD_HASH,
         'role': 'admin',
         'name': 'Administrator'
     },
     'teacher1': {
         'username': 'teacher1',
-        'password': generate_password_hash('teacher123'),
+        'password': DEMO_TEACHER_PASSWORD_HASH,
         'role': 'teacher',
         'name': 'John Smith',
         'subject': 'Mathematics'
     },
     'teacher2': {
         'username': 'teacher2',
-        'password': generate_password_hash('teacher123'),
+        'password': DEMO_TEACHER_PASSWORD_HASH,
         'role': 'teacher',
         'name': 'Sarah Johnson',
         'subject': 'Science'
     },
     'teacher3': {
         'username': 'teacher3',
-        'password': generate_password_hash('teacher123'),
+        'password': DEMO_TEACHER_PASSWORD_HASH,
         'role': 'teacher',
         'name': 'Michael Chen',
         'subject': 'English'
     },
     'teacher4': {
         'username': 'teacher4',
-        'password': generate_password_hash('teacher123'),
+        'password': DEMO_TEACHER_PASSWORD_HASH,
         'role': 'teacher',
         'name': 'Lisa Rodriguez',
         'subject': 'History'
     },
     'teacher5': {
         'username': 'teacher5',
-        'password': generate_password_hash('teacher123'),
+        'password': DEMO_TEACHER_PASSWORD_HASH,
         'role': 'teacher',
         'name': 'David Patel',
         'subject': 'Computer Science'
     },
     'student1': {
         'username': 'student1',
-        'password': generate_password_hash('student123'),
+        'password': DEMO_STUDENT_PASSWORD_HASH,
         'role': 'student',
         'name': 'Alice Johnson',
         'student_id': 'STU0001'
     },
     'student2': {
         'username': 'student2',
-        'password': generate_password_hash('student123'),
+        'password': DEMO_STUDENT_PASSWORD_HASH,
         'role': 'student',
         'name': 'Bob Smith',
         'student_id': 'STU0002'
     },
     'student3': {
         'username': 'student3',
-        'password': generate_password_hash('student123'),
+        'password': DEMO_STUDENT_PASSWORD_HASH,
         'role': 'student',
         'name': 'Carol Davis',
         'student_id': 'STU0003'
     },
     'student4': {
         'username': 'student4',
-        'password': generate_password_hash('student123'),
+        'password': DEMO_STUDENT_PASSWORD_HASH,
         'role': 'student',
         'name': 'David Wilson',
         'student_id': 'STU0004'
     },
     'student5': {
         'username': 'student5',
-        'password': generate_password_hash('student123'),
+        'password': DEMO_STUDENT_PASSWORD_HASH,
         'role': 'student',
         'name': 'Emma Brown',
         'student_id': 'STU0005'
     }
 }
 
+# Number of users per role, kept in sync by create_user
+role_counts = Counter(u['role'] for u in users.values())
+
 class User(UserMixin):
     pass
 
@@ -239,9 +435,9 @@ def resolve_user_display_name(username):
             if user_meta.get('role') == 'student':
                 student_id = user_meta.get('student_id')
                 if student_id is not None:
-                    row = df[df['student_id'] == student_id]
-                    if not row.empty:
-                        full_name = row.iloc[0].get('Full_Name')
+                    row = find_student(student_id)
+                    if row is not None:
+                        full_name = row.get('Full_Name')
                         if pd.notna(full_name) and str(full_name).strip():
                             return str(full_name)
             # Non-students or fallback
@@ -307,21 +503,20 @@ def student_dashboard():
     
     # Get student data
     student_id = users[current_user.username]['student_id']
-    student_rows = df[df['student_id'] == student_id]
-    if student_rows.empty:
+    student_data = find_student(student_id)
+    if student_data is None:
         flash('Student record not found in dataset')
         return redirect(url_for('index'))
-    student_data = student_rows.iloc[0]
     
     # Generate performance prediction
-    features = prepare_features(student_data)
-    prediction = model.predict([features])[0]
+    prediction = predict_performance(student_id, student_data['Attendance'], student_data['Previous_Scores'],
+                                     _dataset_version)
     
     # Create performance charts
-    attendance_chart = create_attendance_chart(student_data)
-    study_hours_chart = create_study_hours_chart(student_data)
-    performance_radar = create_performance_radar(student_data)
-    study_vs_score_chart = create_study_vs_score_scatter(student_data)
+    attendance_chart = cached_student_chart(create_attendance_chart, student_id)
+    study_hours_chart = cached_student_chart(create_study_hours_chart, student_id)
+    performance_radar = cached_student_chart(create_performance_radar, student_id)
+    study_vs_score_chart = cached_student_chart(create_study_vs_score_scatter, student_id)
 
     return render_template('student_dashboard.html', 
                          student=student_data, 
@@ -365,26 +560,26 @@ def teacher_dashboard():
     end_idx = start_idx + per_page
     current_page_students = students_data.iloc[start_idx:end_idx]
     
-    # Create meaningful charts with mean/mode values from the dataset
-    class_performance = create_class_performance_chart(students_data)
-    attendance_distribution = create_attendance_distribution_chart(students_data)
-    subject_analytics = create_subject_analytics_chart(students_data)
+    # Create meaningful charts with mean/mode values from the dataset (cached until the data changes)
+    class_performance = cached_dataset_chart(create_class_performance_chart)
+    attendance_distribution = cached_dataset_chart(create_attendance_distribution_chart)
+    subject_analytics = cached_dataset_chart(create_subject_analytics_chart)
     
     # Create additional meaningful charts
-    study_hours_performance = create_study_hours_performance_chart(students_data)
-    gender_comparison = create_gender_comparison_chart(students_data)
-    attendance_trend = create_attendance_trend_chart(students_data)
+    study_hours_performance = cached_dataset_chart(create_study_hours_performance_chart)
+    gender_comparison = cached_dataset_chart(create_gender_comparison_chart)
+    attendance_trend = cached_dataset_chart(create_attendance_trend_chart)
     
     # Calculate real statistics from actual dataset
-    avg_score = students_data['Previous_Scores'].mean()
-    avg_attendance = students_data['Attendance'].mean()
-    avg_study_hours = students_data['Hours_Studied'].mean()
-    # Counts for insights
-    high_performers_count = int((students_data['Previous_Scores'] >= 80).sum())
-    low_performers_count = int((students_data['Previous_Scores'] < 60).sum())
+    avg_score, avg_attendance, avg_study_hours = (column_values(students_data, col).mean()
+                                                  for col in ['Previous_Scores', 'Attendance', 'Hours_Studied'])
+    # Counts for insights: bucket scores into <60, 60-79 and 80+ in a single pass
+    score_buckets = np.bincount(np.digitize(column_values(students_data, 'Previous_Scores'), [60, 80]), minlength=3)
+    high_performers_count = int(score_buckets[2])
+    low_performers_count = int(score_buckets[0])
     
     return render_template('teacher_dashboard.html',
-                         students=current_page_students.to_dict('records'),
+                         students=list(current_page_students.itertuples(index=False, name='Student')),
                          total_students=total_students,
                          current_page=page,
                          total_pages=total_pages,
@@ -414,62 +609,18 @@ def admin_dashboard():
     total_students = len(df)
     # Active teachers from real teachers dataset; fallback to in-memory
     try:
-        active_teachers = int((teachers_df['status'].str.lower() == 'active').sum()) if not teachers_df.empty else len([u for u in users.values() if u['role'] == 'teacher'])
+        active_teachers = int((teachers_df['status'].str.lower() == 'active').sum()) if not teachers_df.empty else role_counts['teacher']
     except Exception:
-        active_teachers = len([u for u in users.values() if u['role'] == 'teacher'])
-    gender_distribution = create_gender_distribution_chart(df)
-    performance_overview = create_performance_overview_chart(df)
-    school_type_analysis = create_school_type_analysis_chart(df)
+        active_teachers = role_counts['teacher']
+    gender_distribution = cached_dataset_chart(create_gender_distribution_chart)
+    performance_overview = cached_dataset_chart(create_performance_overview_chart)
+    school_type_analysis = cached_dataset_chart(create_school_type_analysis_chart)
     # Count admins for display
-    admin_count = len([u for u in users.values() if u.get('role') == 'admin'])
+    admin_count = role_counts['admin']
     
-    # Calculate real metrics from the dataset
-    try:
-        from sklearn.model_selection import cross_val_score
-        from sklearn.preprocessing import LabelEncoder
-        
-        # Prepare data for accuracy calculation
-        le = LabelEncoder()
-        df_encoded = df.copy()
-        
-        # Encode categorical variables
-        categorical_columns = ['Gender', 'Teacher_Feedback', 'Parental_Involvement', 'Access_to_Resources', 
-                              'Extracurricular_Activities', 'Physical_Activity.1', 'Internet_Access', 
-                              'Family_Income', 'School_Type', 'Peer_Influence', 'Learning_Disabilities', 
-                              'Parental_Education_Level', 'Distance_from_Home']
-        
-        for col in categorical_columns:
-            if col in df_encoded.columns:
-                df_encoded[col] = le.fit_transform(df_encoded[col].astype(str))
-        
-        # Create target variable
-        df_encoded['Performance'] = pd.cut(
-            (df_encoded['Attendance'] + df_encoded['Previous_Scores']) / 2,
-            bins=[0, 60, 80, 100],
-            labels=['Low', 'Medium', 'High']
-        )
-        
-        # Prepare features
-        feature_columns = ['age', 'Attendance', 'Hours_Studied', 'Previous_Scores', 'Sleep_Hours', 
-                          'Physical_Activity', 'Tutoring_Sessions']
-        feature_columns.extend(categorical_columns)
-        
-        X = df_encoded[feature_columns].fillna(0)
-        y = df_encoded['Performance'].fillna('Medium')
-        
-        # Calculate cross-validation accuracy
-        cv_scores = cross_val_score(model, X, y, cv=5, scoring='accuracy')
-        model_accuracy = cv_scores.mean() * 100
-        
-        # Calculate data quality (percentage of non-null values)
-        total_cells = df.size
-        non_null_cells = df.count().sum()
-        data_quality = round((non_null_cells / total_cells) * 100, 1)
-        
-        # Calculate student coverage (percentage of students with complete data)
-        complete_records = df.dropna().shape[0]
-        student_coverage = round((complete_records / total_students) * 100, 1)
-        
+    # Model/data metrics are computed once, on the first admin request (see compute_admin_metrics)
+    model_accuracy, data_quality, student_coverage = compute_admin_metrics()
+    if model_accuracy is not None:
         # Calculate active users percentage (based on user roles)
         total_users = len(users)
         active_users_percentage = round((total_users / (total_users + 5)) * 100, 1)  # Assume some inactive users
@@ -526,8 +677,7 @@ def admin_dashboard():
         # Sort logs by time (most recent first)
         system_logs = system_logs[:5]  # Show only 5 most recent logs
         
-    except Exception as e:
-        print(f"Error calculating metrics: {e}")
+    else:
         # Fallback values
         model_accuracy = 85.0
         data_quality = 92.5
@@ -562,11 +712,11 @@ def get_student_data(student_id):
     if current_user.role not in ['teacher', 'admin']:
         return jsonify({'error': 'Access denied'}), 403
     
-    student_data = df[df['student_id'] == student_id]
-    if student_data.empty:
+    student_data = find_student(student_id)
+    if student_data is None:
         return jsonify({'error': 'Student not found'}), 404
     
-    return jsonify(student_data.iloc[0].to_dict())
+    return jsonify(student_data.to_dict())
 
 @app.route('/api/update_marks', methods=['POST'])
 @login_required
@@ -587,16 +737,17 @@ def update_marks():
         return jsonify({'error': 'Values out of allowed range (0-100)'}), 400
     
     # Update the dataset (in-memory for demo)
-    if student_id in df['student_id'].values:
-        df.loc[df['student_id'] == student_id, 'Attendance'] = attendance
-        df.loc[df['student_id'] == student_id, 'Previous_Scores'] = previous_scores
-
-        try:
-            # Persist updates back to the same dataset file
-            df.to_csv(DATASET_PATH, index=False)
-        except Exception as e:
-            app.logger.error(f"Failed saving dataset updates: {e}")
-            return jsonify({'error': 'Failed to save changes'}), 500
+    if student_id in df.index:
+        with _dataset_lock:
+            df.at[student_id, 'Attendance'] = attendance
+            df.at[student_id, 'Previous_Scores'] = previous_scores
+            # Keep the precomputed model features in sync with the edited row
+            row_idx = df.index.get_loc(student_id)
+            FEATURE_MATRIX[row_idx, FEATURE_COLUMNS.index('Attendance')] = attendance
+            FEATURE_MATRIX[row_idx, FEATURE_COLUMNS.index('Previous_Scores')] = previous_scores
+            # Persist updates back to the same dataset file in the background
+            schedule_dataset_save()
+            mark_dataset_changed()
 
         return jsonify({'success': True, 'message': 'Marks updated successfully'})
     
@@ -622,17 +773,17 @@ def create_user():
     # Generate student ID if creating a student
     student_id = None
     if role == 'student':
-        student_count = len([u for u in users.values() if u['role'] == 'student'])
+        student_count = role_counts['student']
         student_id = f"STU{str(student_count + 1).zfill(4)}"
         
         # Try to get the actual name from the dataset
         try:
-            student_data = df[df['student_id'] == student_id]
-            full_name = student_data.iloc[0]['Full_Name'] if not student_data.empty else f"Student {student_count + 1}"
+            student_data = find_student(student_id)
+            full_name = student_data['Full_Name'] if student_data is not None else f"Student {student_count + 1}"
         except Exception:
             full_name = f"Student {student_count + 1}"
     else:
-        role_count = len([u for u in users.values() if u['role'] == role])
+        role_count = role_counts[role]
         full_name = f"{role.capitalize()} {role_count + 1}"
     
     # Create new user
@@ -647,6 +798,7 @@ def create_user():
         new_user['student_id'] = student_id
     
     users[username] = new_user
+    role_counts[role] += 1
     
     return jsonify({
         'success': True, 
@@ -659,58 +811,24 @@ def create_user():
         }
     })
 
-def prepare_features(student_data):
-    """Prepare features for model prediction"""
-    # This should match the features used during training
-    features = [
-        student_data['age'] if pd.notna(student_data['age']) else 0,
-        student_data['Attendance'],
-        student_data['Hours_Studied'],
-        student_data['Previous_Scores'],
-        student_data['Sleep_Hours'],
-        student_data['Physical_Activity'],
-        student_data['Tutoring_Sessions']
-    ]
-    
-    # Add encoded categorical features if they exist in the model
-    categorical_mapping = {
-        'Gender': {'Male': 0, 'Female': 1},
-        'Teacher_Feedback': {'Low': 0, 'Medium': 1, 'High': 2},
-        'Parental_Involvement': {'Low': 0, 'Medium': 1, 'High': 2},
-        'Access_to_Resources': {'Low': 0, 'Medium': 1, 'High': 2},
-        'Extracurricular_Activities': {'No': 0, 'Yes': 1},
-        'Physical_Activity.1': {'Low': 0, 'Medium': 1, 'High': 2},
-        'Internet_Access': {'No': 0, 'Yes': 1},
-        'Family_Income': {'Low': 0, 'Medium': 1, 'High': 2},
-        'School_Type': {'Public': 0, 'Private': 1},
-        'Peer_Influence': {'Negative': 0, 'Neutral': 1, 'Positive': 2},
-        'Learning_Disabilities': {'No': 0, 'Yes': 1},
-        'Parental_Education_Level': {'High School': 0, 'College': 1, 'Postgraduate': 2},
-        'Distance_from_Home': {'Near': 0, 'Moderate': 1, 'Far': 2}
-    }
-    
-    # Add categorical features in the same order as training
-    for col in ['Gender', 'Teacher_Feedback', 'Parental_Involvement', 'Access_to_Resources', 
-                'Extracurricular_Activities', 'Physical_Activity.1', 'Internet_Access', 
-                'Family_Income', 'School_Type', 'Peer_Influence', 'Learning_Disabilities', 
-                'Parental_Education_Level', 'Distance_from_Home']:
-        if col in student_data and pd.notna(student_data[col]):
-            value = student_data[col]
-            features.append(categorical_mapping[col].get(value, 0))
-        else:
-            features.append(0)
-    
-    # Ensure we have exactly 20 features (7 numerical + 13 categorical)
-    expected_features = 20
-    if len(features) != expected_features:
-        print(f"Warning: Expected {expected_features} features, got {len(features)}")
-        # Pad or truncate to match expected features
-        while len(features) < expected_features:
-            features.append(0)
-        features = features[:expected_features]
-    
-    print(f"Prepared {len(features)} features for prediction")
-    return features
+def prepare_features(row_idx):
+    """Return the model features for the dataset row at position row_idx.
+    The result is a (1, n_features) view of FEATURE_MATRIX, ready for model.predict.
+    """
+    return FEATURE_MATRIX[row_idx:row_idx + 1]
+
+@lru_cache(maxsize=4096)
+def predict_performance(student_id, attendance, previous_scores, dataset_version):
+    """Predict a student's performance level.
+    Cached per student, editable marks and dataset version; update_marks clears the cache.
+    """
+    features = prepare_features(df.index.get_loc(student_id))
+    return model.predict(features)[0]
+
+
+def figure_json(fig):
+    """Serialize a figure for the templates (plotly picks orjson when it is installed)"""
+    return pio.to_json(fig, validate=False)
 
 
 def create_attendance_chart(student_data):
@@ -739,7 +857,7 @@ def create_attendance_chart(student_data):
     ))
     
     fig.update_layout(height=300, margin=dict(l=20, r=20, t=40, b=20))
-    return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+    return figure_json(fig)
 
 def create_study_hours_chart(student_data):
     """Create study hours chart for student dashboard"""
@@ -758,18 +876,20 @@ def create_study_hours_chart(student_data):
         margin=dict(l=20, r=20, t=40, b=20)
     )
     
-    return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+    return figure_json(fig)
+
+RADAR_FIELDS = ['Attendance', 'Hours_Studied', 'Previous_Scores', 'Sleep_Hours', 'Physical_Activity']
+RADAR_DIVISORS = np.array([10, 3, 10, 1.2, 1])  # Normalize each metric to 0-10
+RADAR_CAPS = np.array([np.inf, 10, np.inf, 10, 10])  # Cap the unbounded metrics at 10
+
+def radar_values(metrics):
+    """Scale RADAR_FIELDS values to the 0-10 radar axes; accepts one row or an (n_students, 5) array"""
+    return np.minimum(np.asarray(metrics, dtype=float) / RADAR_DIVISORS, RADAR_CAPS)
 
 def create_performance_radar(student_data):
     """Create performance radar chart for student dashboard"""
     categories = ['Attendance', 'Study Hours', 'Previous Scores', 'Sleep Hours', 'Physical Activity']
-    values = [
-        student_data['Attendance'] / 100 * 10,  # Normalize to 0-10
-        min(student_data['Hours_Studied'] / 3, 10),  # Cap at 10
-        student_data['Previous_Scores'] / 100 * 10,  # Normalize to 0-10
-        min(student_data['Sleep_Hours'] / 1.2, 10),  # Cap at 10
-        min(student_data['Physical_Activity'] / 1, 10)  # Cap at 10
-    ]
+    values = radar_values(student_data[RADAR_FIELDS].to_numpy(dtype=float)).tolist()
     
     fig = go.Figure()
     fig.add_trace(go.Scatterpolar(
@@ -790,14 +910,13 @@ def create_performance_radar(student_data):
         margin=dict(l=20, r=20, t=40, b=20)
     )
     
-    return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+    return figure_json(fig)
 
 def create_study_vs_score_scatter(student_data):
     """Bivariate: Study hours vs previous score for the selected student compared to cohort."""
     try:
-        # Use global df for cohort context; highlight current student
-        cohort_x = df['Hours_Studied']
-        cohort_y = df['Previous_Scores']
+        # Use a cached sample of the global df for cohort context; highlight current student
+        cohort_x, cohort_y = cohort_sample(_dataset_version)
         fig = go.Figure()
         fig.add_trace(go.Scatter(
             x=cohort_x,
@@ -822,21 +941,41 @@ def create_study_vs_score_scatter(student_data):
             height=300,
             margin=dict(l=20, r=20, t=40, b=20)
         )
-        return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+        return figure_json(fig)
     except Exception:
         # Fallback simple point
         fig = go.Figure()
         fig.add_trace(go.Scatter(x=[student_data.get('Hours_Studied', 0)], y=[student_data.get('Previous_Scores', 0)], mode='markers'))
-        return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+        return figure_json(fig)
+
+# Cohort points drawn on the study-vs-score scatter (keeps the per-student chart JSON small)
+COHORT_SAMPLE_SIZE = 2000
+
+@lru_cache(maxsize=1)
+def cohort_sample(dataset_version):
+    """Return (hours studied, previous scores) arrays for a fixed random sample of students.
+    Cached per dataset version.
+    """
+    # Native integer dtypes let Plotly emit compact typed arrays
+    hours = column_values(df, 'Hours_Studied')
+    scores = column_values(df, 'Previous_Scores')
+    rng = np.random.default_rng(0)
+    idx = rng.choice(len(hours), size=min(COHORT_SAMPLE_SIZE, len(hours)), replace=False)
+    return hours[idx], scores[idx]
+
+
+PERFORMANCE_LEVELS = ('Low', 'Medium', 'High')
+
 
 def create_class_performance_chart(students_data):
     """Create class performance overview chart"""
-    performance_counts = students_data['Previous_Scores'].apply(
-        lambda x: 'High' if x >= 80 else 'Medium' if x >= 60 else 'Low'
-    ).value_counts()
+    # Low < 60 <= Medium < 80 <= High, listed most common first like value_counts()
+    levels = np.digitize(column_values(students_data, 'Previous_Scores'), [60, 80])
+    level_counts = np.bincount(levels, minlength=len(PERFORMANCE_LEVELS))
+    order = [i for i in np.argsort(-level_counts, kind='stable') if level_counts[i]]
     
     fig = go.Figure(data=[
-        go.Pie(labels=performance_counts.index, values=performance_counts.values,
+        go.Pie(labels=[PERFORMANCE_LEVELS[i] for i in order], values=level_counts[order],
                hole=0.3, marker_colors=['#2E8B57', '#FFD700', '#DC143C'])
     ])
     
@@ -846,29 +985,73 @@ def create_class_performance_chart(students_data):
         margin=dict(l=20, r=20, t=40, b=20)
     )
     
-    return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+    return figure_json(fig)
+
+_aggregation_cache = {}
+
+
+def cached_aggregation(name, frame, compute):
+    """Return compute(frame), memoized per frame until mark_dataset_changed() is called"""
+    key = (name, id(frame), _dataset_version)
+    value = _aggregation_cache.get(key)
+    if value is None:
+        value = compute(frame)
+        _aggregation_cache[key] = value
+    return value
+
+
+def column_values(frame, column):
+    """Read-only numpy view of frame[column], cached per frame until mark_dataset_changed() is called"""
+    def compute(frame):
+        values = frame[column].to_numpy().view()
+        values.flags.writeable = False
+        return values
+    return cached_aggregation(('column', column), frame, compute)
+
+
+ATTENDANCE_BINS = np.array([0, 50, 75, 85, 100])
+ATTENDANCE_LABELS = ('0-50%', '50-75%', '75-85%', '85%+')
+SCORE_BINS = np.array([0, 60, 80, 100])
+SCORE_RANGE_LABELS = ('Low (0-60)', 'Medium (60-80)', 'High (80-100)')
+STUDY_HOUR_BINS = np.array([0, 15, 25, 35, 50])
+STUDY_HOUR_LABELS = ('0-15h', '15-25h', '25-35h', '35h+')
+
+
+def bin_codes(values, bins):
+    """Right-closed bin index per value, as pd.cut, and a mask of values inside (bins[0], bins[-1]]"""
+    return (np.searchsorted(bins, values, side='left') - 1,
+            (values > bins[0]) & (values <= bins[-1]))
+
+
+def attendance_bands(students_data):
+    """Attendance band index per student and a mask of rows inside (0, 100]"""
+    return cached_aggregation('attendance_bands', students_data,
+                              lambda frame: bin_codes(column_values(frame, 'Attendance'), ATTENDANCE_BINS))
+
 
 def create_attendance_distribution_chart(students_data):
     """Create attendance distribution chart with gender analysis"""
-    # Create attendance bins for analysis
-    attendance_bins = pd.cut(students_data['Attendance'], 
-                            bins=[0, 50, 75, 85, 100], 
-                            labels=['0-50%', '50-75%', '75-85%', '85%+'])
-    
-    # Group by attendance bins and gender
-    attendance_gender = students_data.groupby([attendance_bins, 'Gender']).size().unstack(fill_value=0)
+    # Count students per attendance band and gender in a single bincount
+    bands, in_range = attendance_bands(students_data)
+    genders, gender_idx = np.unique(column_values(students_data, 'Gender')[in_range], return_inverse=True)
+    attendance_gender = np.bincount(bands[in_range] * len(genders) + gender_idx,
+                                    minlength=len(ATTENDANCE_LABELS) * len(genders)
+                                    ).reshape(len(ATTENDANCE_LABELS), len(genders))
+    observed = attendance_gender.sum(axis=1) > 0
+    band_labels = [label for label, seen in zip(ATTENDANCE_LABELS, observed) if seen]
+    attendance_gender = attendance_gender[observed]
     
     fig = go.Figure()
     
     # Add bars for each gender
     colors = {'Male': '#4ECDC4', 'Female': '#FF6B6B'}
-    for gender in attendance_gender.columns:
+    for i, gender in enumerate(genders):
         fig.add_trace(go.Bar(
             name=f'{gender} Students',
-            x=attendance_gender.index,
-            y=attendance_gender[gender],
+            x=band_labels,
+            y=attendance_gender[:, i],
             marker_color=colors[gender],
-            text=attendance_gender[gender],
+            text=attendance_gender[:, i],
             textposition='auto'
         ))
     
@@ -881,16 +1064,33 @@ def create_attendance_distribution_chart(students_data):
         barmode='group'
     )
     
-    return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+    return figure_json(fig)
+
+MEAN_COLUMNS = ['Previous_Scores', 'Attendance', 'Hours_Studied']
+
+
+def group_means(frame, key, columns=MEAN_COLUMNS):
+    """Per-group means of columns (sorted by group, missing keys skipped) using bincount sums"""
+    codes, groups = pd.factorize(frame[key], sort=True)
+    keep = codes >= 0
+    codes = codes[keep]
+    counts = np.bincount(codes, minlength=len(groups))
+    return pd.DataFrame({
+        col: np.bincount(codes, weights=column_values(frame, col)[keep], minlength=len(groups)) / counts
+        for col in columns
+    }, index=pd.Index(groups, name=key))
+
+
+def school_type_stats(students_data):
+    """Score/attendance/study-hour means by school type, shared by the teacher and admin charts"""
+    return cached_aggregation('school_type', students_data,
+                              lambda frame: group_means(frame, 'School_Type').round(2))
+
 
 def create_subject_analytics_chart(students_data):
     """Create school type analysis chart with mean values"""
     # Calculate comprehensive stats by school type
-    school_stats = students_data.groupby('School_Type').agg({
-        'Previous_Scores': ['mean', 'count'],
-        'Attendance': 'mean',
-        'Hours_Studied': 'mean'
-    }).round(2)
+    school_stats = school_type_stats(students_data)
     
     fig = go.Figure()
     
@@ -898,10 +1098,10 @@ def create_subject_analytics_chart(students_data):
     fig.add_trace(go.Bar(
         name='Average Score',
         x=school_stats.index,
-        y=school_stats[('Previous_Scores', 'mean')],
+        y=school_stats['Previous_Scores'],
         yaxis='y',
         marker_color=['#FF6B6B', '#4ECDC4'],
-        text=school_stats[('Previous_Scores', 'mean')],
+        text=school_stats['Previous_Scores'],
         textposition='auto'
     ))
     
@@ -909,10 +1109,10 @@ def create_subject_analytics_chart(students_data):
     fig.add_trace(go.Bar(
         name='Average Attendance',
         x=school_stats.index,
-        y=school_stats[('Attendance', 'mean')],
+        y=school_stats['Attendance'],
         yaxis='y2',
         marker_color=['#FF8E8E', '#6EDDD6'],
-        text=school_stats[('Attendance', 'mean')].round(1),
+        text=school_stats['Attendance'].round(1),
         textposition='auto'
     ))
     
@@ -925,7 +1125,7 @@ def create_subject_analytics_chart(students_data):
         barmode='group'
     )
     
-    return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+    return figure_json(fig)
 
 def create_gender_distribution_chart(df):
     """Create gender distribution chart for admin dashboard"""
@@ -942,17 +1142,16 @@ def create_gender_distribution_chart(df):
         margin=dict(l=20, r=20, t=40, b=20)
     )
     
-    return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+    return figure_json(fig)
 
 def create_performance_overview_chart(df):
     """Create performance overview chart for admin dashboard"""
-    performance_ranges = pd.cut(df['Previous_Scores'], 
-                               bins=[0, 60, 80, 100], 
-                               labels=['Low (0-60)', 'Medium (60-80)', 'High (80-100)'])
-    performance_counts = performance_ranges.value_counts()
+    codes, in_range = bin_codes(column_values(df, 'Previous_Scores'), SCORE_BINS)
+    range_counts = np.bincount(codes[in_range], minlength=len(SCORE_RANGE_LABELS))
+    order = np.argsort(-range_counts, kind='stable')  # Most common first, like value_counts()
     
     fig = go.Figure(data=[
-        go.Bar(x=performance_counts.index, y=performance_counts.values,
+        go.Bar(x=[SCORE_RANGE_LABELS[i] for i in order], y=range_counts[order],
                marker_color=['#DC143C', '#FFD700', '#2E8B57'])
     ])
     
@@ -964,28 +1163,25 @@ def create_performance_overview_chart(df):
         margin=dict(l=20, r=20, t=40, b=20)
     )
     
-    return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+    return figure_json(fig)
 
 def create_school_type_analysis_chart(df):
     """Create school type analysis chart for admin dashboard"""
-    school_stats = df.groupby('School_Type').agg({
-        'Previous_Scores': ['mean', 'count'],
-        'Attendance': 'mean'
-    }).round(2)
+    school_stats = school_type_stats(df)
     
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
         name='Average Score',
         x=school_stats.index,
-        y=school_stats[('Previous_Scores', 'mean')],
+        y=school_stats['Previous_Scores'],
         yaxis='y'
     ))
     
     fig.add_trace(go.Bar(
         name='Average Attendance',
         x=school_stats.index,
-        y=school_stats[('Attendance', 'mean')],
+        y=school_stats['Attendance'],
         yaxis='y2'
     ))
     
@@ -997,28 +1193,32 @@ def create_school_type_analysis_chart(df):
         margin=dict(l=20, r=20, t=40, b=20)
     )
     
-    return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+    return figure_json(fig)
 
 
 def create_study_hours_performance_chart(students_data):
     """Create study hours vs performance scatter chart with mean values"""
     # Calculate mean scores for different study hour ranges
-    study_hour_ranges = pd.cut(students_data['Hours_Studied'], 
-                              bins=[0, 15, 25, 35, 50], 
-                              labels=['0-15h', '15-25h', '25-35h', '35h+'])
+    codes, in_range = bin_codes(column_values(students_data, 'Hours_Studied'), STUDY_HOUR_BINS)
+    codes = codes[in_range]
+    counts = np.bincount(codes, minlength=len(STUDY_HOUR_LABELS))
+    score_sums = np.bincount(codes, weights=column_values(students_data, 'Previous_Scores')[in_range],
+                             minlength=len(STUDY_HOUR_LABELS))
     
-    study_performance = students_data.groupby(study_hour_ranges)['Previous_Scores'].agg(['mean', 'count']).reset_index()
-    study_performance = study_performance.dropna()
+    observed = counts > 0
+    hour_labels = [label for label, seen in zip(STUDY_HOUR_LABELS, observed) if seen]
+    counts = counts[observed]
+    mean_scores = score_sums[observed] / counts
     
     fig = go.Figure(data=[
         go.Bar(
-            x=study_performance['Hours_Studied'],
-            y=study_performance['mean'],
-            text=study_performance['mean'].round(1),
+            x=hour_labels,
+            y=mean_scores,
+            text=mean_scores.round(1),
             textposition='auto',
             marker_color=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4'],
             hovertemplate='Study Hours: %{x}<br>Average Score: %{y:.1f}<br>Students: %{customdata}<extra></extra>',
-            customdata=study_performance['count']
+            customdata=counts
         )
     ])
     
@@ -1030,17 +1230,13 @@ def create_study_hours_performance_chart(students_data):
         margin=dict(l=20, r=20, t=40, b=20)
     )
     
-    return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+    return figure_json(fig)
 
 
 def create_gender_comparison_chart(students_data):
     """Create gender performance comparison chart with mean values"""
     # Calculate mean values by gender
-    gender_stats = students_data.groupby('Gender').agg({
-        'Previous_Scores': 'mean',
-        'Attendance': 'mean',
-        'Hours_Studied': 'mean'
-    }).round(2)
+    gender_stats = group_means(students_data, 'Gender').round(2)
     
     fig = go.Figure()
     
@@ -1072,46 +1268,50 @@ def create_gender_comparison_chart(students_data):
         margin=dict(l=20, r=20, t=40, b=20)
     )
     
-    return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+    return figure_json(fig)
 
 
 def create_attendance_trend_chart(students_data):
     """Create attendance impact on performance chart with mean values"""
-    # Create attendance bins for analysis
-    attendance_bins = pd.cut(students_data['Attendance'], 
-                            bins=[0, 50, 75, 85, 100], 
-                            labels=['0-50%', '50-75%', '75-85%', '85%+'])
-    
-    attendance_performance = students_data.groupby(attendance_bins).agg({
-        'Previous_Scores': 'mean',
-        'Hours_Studied': 'mean',
-        'Gender': 'count'
-    }).reset_index()
-    attendance_performance = attendance_performance.dropna()
+    # Accumulate per-band sums and counts, then keep only the bands that have students
+    bands, in_range = attendance_bands(students_data)
+    bands = bands[in_range]
+    counts = np.zeros(len(ATTENDANCE_LABELS), dtype=np.int64)
+    score_sums = np.zeros(len(ATTENDANCE_LABELS))
+    hour_sums = np.zeros(len(ATTENDANCE_LABELS))
+    np.add.at(counts, bands, 1)
+    np.add.at(score_sums, bands, column_values(students_data, 'Previous_Scores')[in_range])
+    np.add.at(hour_sums, bands, column_values(students_data, 'Hours_Studied')[in_range])
+    
+    observed = counts > 0
+    band_labels = [label for label, seen in zip(ATTENDANCE_LABELS, observed) if seen]
+    counts = counts[observed]
+    mean_scores = score_sums[observed] / counts
+    mean_hours = hour_sums[observed] / counts
     
     fig = go.Figure()
     
     fig.add_trace(go.Scatter(
-        x=attendance_performance['Attendance'],
-        y=attendance_performance['Previous_Scores'],
+        x=band_labels,
+        y=mean_scores,
         mode='lines+markers',
         line=dict(width=3, color='#6366f1'),
         marker=dict(size=10, color='#6366f1'),
         name='Average Score',
-        text=attendance_performance['Previous_Scores'].round(1),
+        text=mean_scores.round(1),
         hovertemplate='Attendance: %{x}<br>Average Score: %{y:.1f}<br>Students: %{customdata}<extra></extra>',
-        customdata=attendance_performance['Gender']
+        customdata=counts
     ))
     
     fig.add_trace(go.Scatter(
-        x=attendance_performance['Attendance'],
-        y=attendance_performance['Hours_Studied'],
+        x=band_labels,
+        y=mean_hours,
         mode='lines+markers',
         line=dict(width=3, color='#10b981', dash='dash'),
         marker=dict(size=10, color='#10b981'),
         name='Average Study Hours',
         yaxis='y2',
-        text=attendance_performance['Hours_Studied'].round(1),
+        text=mean_hours.round(1),
         hovertemplate='Attendance: %{x}<br>Average Study Hours: %{y:.1f}<extra></extra>'
     ))
     
@@ -1124,7 +1324,66 @@ def create_attendance_trend_chart(students_data):
         margin=dict(l=20, r=20, t=40, b=20)
     )
     
-    return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+    return figure_json(fig)
+
+
+@lru_cache(maxsize=32)
+def _dataset_chart(builder, dataset_version):
+    return builder(df)
+
+
+@lru_cache(maxsize=4096)
+def _student_chart(builder, student_id, dataset_version):
+    return builder(find_student(student_id))
+
+
+def cached_dataset_chart(builder):
+    """Return builder(df) chart JSON, cached until mark_dataset_changed() is called"""
+    return _dataset_chart(builder, _dataset_version)
+
+
+def cached_student_chart(builder, student_id):
+    """Return builder(student row) chart JSON, cached per student until the data changes"""
+    return _student_chart(builder, student_id, _dataset_version)
+
+
+DATASET_CHARTS = (
+    create_class_performance_chart,
+    create_attendance_distribution_chart,
+    create_subject_analytics_chart,
+    create_study_hours_performance_chart,
+    create_gender_comparison_chart,
+    create_attendance_trend_chart,
+    create_gender_distribution_chart,
+    create_performance_overview_chart,
+    create_school_type_analysis_chart,
+)
+
+
+def warm_dataset_charts():
+    """Build every dataset-wide dashboard chart so requests are served from cache"""
+    for builder in DATASET_CHARTS:
+        try:
+            cached_dataset_chart(builder)
+        except Exception as e:
+            app.logger.warning(f"Could not precompute {builder.__name__}: {e}")
+
+
+def mark_dataset_changed():
+    """Invalidate cached predictions, aggregations and charts after df has been modified.
+    Call while holding _dataset_lock. Bumping the version makes anything still being computed
+    from the old data unreachable; clearing the caches frees the old entries.
+    """
+    global _dataset_version
+    _dataset_version += 1
+    predict_performance.cache_clear()
+    cohort_sample.cache_clear()
+    _aggregation_cache.clear()
+    _dataset_chart.cache_clear()
+    _student_chart.cache_clear()
+
+
+warm_dataset_charts()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,24 @@
+"""Column dtypes shared by the dataset scripts"""
+
+# Low-cardinality text columns, read as categories so they are stored as small integer codes
+CATEGORY_DTYPES = {
+    'Gender': 'category',
+    'School_Type': 'category',
+    'Parental_Involvement': 'category',
+    'Access_to_Resources': 'category',
+    'Family_Income': 'category',
+    'Peer_Influence': 'category',
+    'Parental_Education_Level': 'category',
+    'Distance_from_Home': 'category',
+    'Teacher_Feedback': 'category',
+}
+
+# Small non-negative integer columns, read as 16-bit Arrow integers instead of int64
+ARROW_INT_DTYPES = {
+    'Attendance': 'int16[pyarrow]',
+    'Hours_Studied': 'int16[pyarrow]',
+    'Previous_Scores': 'int16[pyarrow]',
+    'Sleep_Hours': 'int16[pyarrow]',
+    'Physical_Activity': 'int16[pyarrow]',
+    'Tutoring_Sessions': 'int16[pyarrow]',
+}
@@ -0,0 +1,21 @@
+import os
+import pandas as pd
+
+def export_csv():
+    """Export the generated Parquet datasets as CSV for external tools"""
+    
+    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+    data_dir = os.path.join(base_dir, 'data')
+    
+    for name in ['student_names_generated', 'StudentPerformance_with_names']:
+        parquet_path = os.path.join(data_dir, f'{name}.parquet')
+        if not os.path.exists(parquet_path):
+            print(f"Skipping '{parquet_path}' (not found)")
+            continue
+        
+        csv_path = os.path.join(data_dir, f'{name}.csv')
+        pd.read_parquet(parquet_path).to_csv(csv_path, index=False)
+        print(f"Exported '{csv_path}'")
+
+if __name__ == "__main__":
+    export_csv()
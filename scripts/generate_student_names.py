@@ -1,86 +1,70 @@
 import os
+import numpy as np
 import pandas as pd
-import random
-import string
+from dataset_dtypes import CATEGORY_DTYPES
+from generate_summary_report import generate_summary_report
 
-def generate_random_names():
+# Unique common first names by gender and last names, as object arrays for rng.choice
+MALE_NAMES = np.array([
+    "James", "John", "Robert", "Michael", "William", "David", "Richard", "Joseph", "Thomas", "Christopher",
+    "Charles", "Daniel", "Matthew", "Anthony", "Mark", "Donald", "Steven", "Paul", "Andrew", "Joshua",
+    "Kenneth", "Kevin", "Brian", "George", "Edward", "Ronald", "Timothy", "Jason", "Jeffrey", "Ryan",
+    "Jacob", "Gary", "Nicholas", "Eric", "Jonathan", "Stephen", "Larry", "Justin", "Scott", "Brandon",
+    "Benjamin", "Frank", "Gregory", "Raymond", "Samuel", "Patrick", "Alexander", "Jack", "Dennis", "Jerry",
+    "Tyler", "Aaron", "Jose", "Adam", "Nathan", "Henry", "Douglas", "Zachary", "Peter", "Kyle",
+    "Walter", "Ethan", "Jeremy", "Harold", "Carl", "Keith", "Roger", "Gerald", "Christian", "Terry",
+    "Sean", "Austin", "Noah", "Lucas", "Jesse", "Logan", "Dylan", "Isaac"
+], dtype=object)
+
+FEMALE_NAMES = np.array([
+    "Mary", "Patricia", "Jennifer", "Linda", "Elizabeth", "Barbara", "Susan", "Jessica", "Sarah", "Karen",
+    "Nancy", "Lisa", "Betty", "Helen", "Sandra", "Donna", "Carol", "Ruth", "Sharon", "Michelle",
+    "Laura", "Emily", "Kimberly", "Deborah", "Dorothy"
+], dtype=object)
+
+LAST_NAMES = np.array([
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+    "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin",
+    "Lee", "Perez", "Thompson", "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson",
+    "Walker", "Young", "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill", "Flores",
+    "Green", "Adams", "Nelson", "Baker", "Hall", "Rivera", "Campbell", "Mitchell", "Carter", "Roberts",
+    "Gomez", "Phillips", "Evans", "Turner", "Diaz", "Parker", "Cruz", "Edwards", "Collins", "Reyes",
+    "Stewart", "Morris", "Morales", "Murphy", "Peterson", "Bailey", "Reed", "Kelly", "Howard", "Ramos",
+    "Kim", "Cox", "Ward", "Gray", "Riley", "Cooper", "Richardson"
+], dtype=object)
+
+# Fixed seed so regenerated names are reproducible
+NAME_SEED = 42
+
+def generate_random_names(seed=NAME_SEED):
     """Generate random student names based on gender"""
     
     # Resolve dataset path relative to project root
     base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
     data_dir = os.path.join(base_dir, 'data')
     cleaned_csv = os.path.join(data_dir, 'StudentPerformance_cleaned.csv')
-    df = pd.read_csv(cleaned_csv)
-    
-    # Lists of common first names by gender
-    male_names = [
-        "James", "John", "Robert", "Michael", "William", "David", "Richard", "Joseph", "Thomas", "Christopher",
-        "Charles", "Daniel", "Matthew", "Anthony", "Mark", "Donald", "Steven", "Paul", "Andrew", "Joshua",
-        "Kenneth", "Kevin", "Brian", "George", "Edward", "Ronald", "Timothy", "Jason", "Jeffrey", "Ryan",
-        "Jacob", "Gary", "Nicholas", "Eric", "Jonathan", "Stephen", "Larry", "Justin", "Scott", "Brandon",
-        "Benjamin", "Frank", "Gregory", "Raymond", "Samuel", "Patrick", "Alexander", "Jack", "Dennis", "Jerry",
-        "Tyler", "Aaron", "Jose", "Adam", "Nathan", "Henry", "Douglas", "Zachary", "Peter", "Kyle",
-        "Walter", "Ethan", "Jeremy", "Harold", "Kyle", "Carl", "Keith", "Roger", "Gerald", "Christian",
-        "Terry", "Sean", "Austin", "Noah", "Lucas", "Jesse", "Logan", "Dylan", "Nathan", "Isaac"
-    ]
+    df = pd.read_csv(cleaned_csv, dtype=CATEGORY_DTYPES)
     
-    female_names = [
-        "Mary", "Patricia", "Jennifer", "Linda", "Elizabeth", "Barbara", "Susan", "Jessica", "Sarah", "Karen",
-        "Nancy", "Lisa", "Betty", "Helen", "Sandra", "Donna", "Carol", "Ruth", "Sharon", "Michelle",
-        "Laura", "Emily", "Kimberly", "Deborah", "Dorothy", "Lisa", "Nancy", "Karen", "Betty", "Helen",
-        "Sandra", "Donna", "Carol", "Ruth", "Sharon", "Michelle", "Laura", "Emily", "Kimberly", "Deborah",
-        "Dorothy", "Lisa", "Nancy", "Karen", "Betty", "Helen", "Sandra", "Donna", "Carol", "Ruth",
-        "Sharon", "Michelle", "Laura", "Emily", "Kimberly", "Deborah", "Dorothy", "Lisa", "Nancy", "Karen",
-        "Betty", "Helen", "Sandra", "Donna", "Carol", "Ruth", "Sharon", "Michelle", "Laura", "Emily",
-        "Kimberly", "Deborah", "Dorothy", "Lisa", "Nancy", "Karen", "Betty", "Helen", "Sandra", "Donna",
-        "Carol", "Ruth", "Sharon", "Michelle", "Laura", "Emily", "Kimberly", "Deborah", "Dorothy", "Lisa"
-    ]
-    
-    # Lists of common last names
-    last_names = [
-        "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
-        "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin",
-        "Lee", "Perez", "Thompson", "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson",
-        "Walker", "Young", "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill", "Flores",
-        "Green", "Adams", "Nelson", "Baker", "Hall", "Rivera", "Campbell", "Mitchell", "Carter", "Roberts",
-        "Gomez", "Phillips", "Evans", "Turner", "Diaz", "Parker", "Cruz", "Edwards", "Collins", "Reyes",
-        "Stewart", "Morris", "Morales", "Murphy", "Peterson", "Bailey", "Reed", "Kelly", "Howard", "Ramos",
-        "Kim", "Cox", "Ward", "Torres", "Peterson", "Gray", "Riley", "Cooper", "Richardson", "Cox",
-        "Howard", "Ward", "Torres", "Peterson", "Gray", "Riley", "Cooper", "Richardson", "Cox", "Howard"
-    ]
-    
-    # Generate random names for each student
-    student_names = []
-    
-    for index, row in df.iterrows():
-        gender = row['Gender']
-        student_id = row['student_id']
-        
-        # Select first name based on gender
-        if gender == 'Male':
-            first_name = random.choice(male_names)
-        else:  # Female
-            first_name = random.choice(female_names)
-        
-        # Select random last name
-        last_name = random.choice(last_names)
-        
-        # Generate full name
-        full_name = f"{first_name} {last_name}"
-        
-        student_names.append({
-            'student_id': student_id,
-            'Gender': gender,
-            'Full_Name': full_name,
-            'First_Name': first_name,
-            'Last_Name': last_name
-        })
+    # Draw first names per gender and last names for all students in one pass
+    rng = np.random.default_rng(seed)
+    is_male = df['Gender'].to_numpy() == 'Male'
+    firsts = np.empty(len(df), dtype=object)
+    firsts[is_male] = rng.choice(MALE_NAMES, size=is_male.sum())
+    firsts[~is_male] = rng.choice(FEMALE_NAMES, size=(~is_male).sum())
+    lasts = rng.choice(LAST_NAMES, size=len(df))
     
     # Create DataFrame with names
-    names_df = pd.DataFrame(student_names)
-    
-    # Save to CSV
-    names_df.to_csv(os.path.join(data_dir, 'student_names_generated.csv'), index=False)
+    names_df = pd.DataFrame({
+        'student_id': df['student_id'].to_numpy(),
+        'Gender': df['Gender'].to_numpy(),
+        'Full_Name': firsts + ' ' + lasts,
+        'First_Name': firsts,
+        'Last_Name': lasts
+    })
+    
+    # Save to Parquet
+    names_path = os.path.join(data_dir, 'student_names_generated.parquet')
+    names_df.to_parquet(names_path, engine='pyarrow', compression='zstd', index=False)
     
     # Display sample results
     print("Sample of generated student names:")
@@ -88,9 +72,9 @@ def generate_random_names():
     print(f"{'Student ID':<12} {'Gender':<8} {'Full Name':<25}")
     print("-" * 60)
     
-    for i in range(min(20, len(names_df))):
-        row = names_df.iloc[i]
-        print(f"{row['student_id']:<12} {row['Gender']:<8} {row['Full_Name']:<25}")
+    sample = names_df.head(20)[['student_id', 'Gender', 'Full_Name']].to_numpy()
+    for student_id, gender, full_name in sample:
+        print(f"{student_id:<12} {gender:<8} {full_name:<25}")
     
     print(f"\nTotal students processed: {len(names_df)}")
     print(f"Male students: {len(names_df[names_df['Gender'] == 'Male'])}")
@@ -100,8 +84,9 @@ def generate_random_names():
     print("\nCross-reference with original dataset:")
     print("=" * 50)
     
-    # Merge with original data
-    merged_df = pd.merge(df, names_df[['student_id', 'Full_Name']], on='student_id', how='left')
+    # Names were drawn in the same row order as df, so attach them positionally
+    merged_df = df.copy()
+    merged_df['Full_Name'] = names_df['Full_Name'].to_numpy()
     
     # Show some statistics
     print(f"Original dataset rows: {len(df)}")
@@ -109,13 +94,14 @@ def generate_random_names():
     print(f"Merged dataset rows: {len(merged_df)}")
     
     # Save merged dataset
-    merged_path = os.path.join(data_dir, 'StudentPerformance_with_names.csv')
-    merged_df.to_csv(merged_path, index=False)
+    merged_path = os.path.join(data_dir, 'StudentPerformance_with_names.parquet')
+    merged_df.to_parquet(merged_path, engine='pyarrow', compression='zstd', index=False)
     print(f"\nMerged dataset saved as '{merged_path}'")
-    print(f"Names only saved as '{os.path.join(data_dir, 'student_names_generated.csv')}'")
+    print(f"Names only saved as '{names_path}'")
     
-    return names_df, merged_df
+    return names_df, df, merged_df
 
 if __name__ == "__main__":
     print("Generating random student names based on gender...")
-    names_df, merged_df = generate_random_names()
+    names_df, original_df, merged_df = generate_random_names()
+    generate_summary_report(names_df, original_df, merged_df)
@@ -1,21 +1,27 @@
 import os
 import pandas as pd
 import random
+from dataset_dtypes import CATEGORY_DTYPES
 
-def generate_summary_report():
-    """Generate a comprehensive summary report of the generated names"""
+def load_generated_datasets():
+    """Read the generated names, original and merged datasets from disk"""
     
     base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
     data_dir = os.path.join(base_dir, 'data')
 
     # Read the generated names
-    names_df = pd.read_csv(os.path.join(data_dir, 'student_names_generated.csv'))
+    names_df = pd.read_parquet(os.path.join(data_dir, 'student_names_generated.parquet'))
     
     # Read the original dataset
-    original_df = pd.read_csv(os.path.join(data_dir, 'StudentPerformance_cleaned.csv'))
+    original_df = pd.read_csv(os.path.join(data_dir, 'StudentPerformance_cleaned.csv'), dtype=CATEGORY_DTYPES)
     
     # Read the merged dataset
-    merged_df = pd.read_csv(os.path.join(data_dir, 'StudentPerformance_with_names.csv'))
+    merged_df = pd.read_parquet(os.path.join(data_dir, 'StudentPerformance_with_names.parquet'))
+    
+    return names_df, original_df, merged_df
+
+def generate_summary_report(names_df, original_df, merged_df):
+    """Generate a comprehensive summary report of the generated names"""
     
     print("=" * 80)
     print("STUDENT NAMES GENERATION SUMMARY REPORT")
@@ -47,14 +53,9 @@ def generate_summary_report():
     
     # Check for gender consistency
     print(f"\n🔍 GENDER CONSISTENCY CHECK:")
-    gender_match = 0
-    gender_mismatch = 0
-    
-    for idx, row in names_df.iterrows():
-        if row['Gender'] == original_df.iloc[idx]['Gender']:
-            gender_match += 1
-        else:
-            gender_mismatch += 1
+    match_mask = names_df['Gender'].to_numpy() == original_df['Gender'].to_numpy()
+    gender_match = int(match_mask.sum())
+    gender_mismatch = len(match_mask) - gender_match
     
     print(f"   • Gender matches: {gender_match:,}")
     print(f"   • Gender mismatches: {gender_mismatch:,}")
@@ -65,13 +66,13 @@ def generate_summary_report():
     
     print(f"\n   🚹 MALE STUDENTS (Sample of 10):")
     male_sample = names_df[names_df['Gender'] == 'Male'].head(10)
-    for _, row in male_sample.iterrows():
-        print(f"      {row['student_id']}: {row['Full_Name']}")
+    for student_id, full_name in male_sample[['student_id', 'Full_Name']].to_numpy():
+        print(f"      {student_id}: {full_name}")
     
     print(f"\n   🚺 FEMALE STUDENTS (Sample of 10):")
     female_sample = names_df[names_df['Gender'] == 'Female'].head(10)
-    for _, row in female_sample.iterrows():
-        print(f"      {row['student_id']}: {row['Full_Name']}")
+    for student_id, full_name in female_sample[['student_id', 'Full_Name']].to_numpy():
+        print(f"      {student_id}: {full_name}")
     
     # Unique names analysis
     print(f"\n📝 NAME UNIQUENESS ANALYSIS:")
@@ -93,8 +94,8 @@ def generate_summary_report():
     
     # File information
     print(f"\n💾 GENERATED FILES:")
-    print(f"   • student_names_generated.csv - Contains only names and IDs")
-    print(f"   • StudentPerformance_with_names.csv - Original data + names")
+    print(f"   • student_names_generated.parquet - Contains only names and IDs")
+    print(f"   • StudentPerformance_with_names.parquet - Original data + names")
     
     # Verification summary
     print(f"\n🎯 VERIFICATION SUMMARY:")
@@ -106,4 +107,4 @@ def generate_summary_report():
     print(f"\n" + "=" * 80)
 
 if __name__ == "__main__":
-    generate_summary_report()
+    generate_summary_report(*load_generated_datasets())
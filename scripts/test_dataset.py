@@ -1,6 +1,8 @@
 import pandas as pd
 import sys
 import os
+import pyarrow.parquet as pq
+from dataset_dtypes import ARROW_INT_DTYPES
 
 def test_dataset():
     """Test if the organized dataset works properly"""
@@ -11,12 +13,21 @@ def test_dataset():
         data_dir = os.path.join(base_dir, 'data')
         organized_path = os.path.join(data_dir, 'StudentPerformance_organized.csv')
         merged_path = os.path.join(data_dir, 'StudentPerformance_with_names.csv')
-        target_path = merged_path if os.path.exists(merged_path) else organized_path
-        df = pd.read_csv(target_path)
+        merged_parquet_path = os.path.join(data_dir, 'StudentPerformance_with_names.parquet')
+        # Only the columns exercised below are loaded; the header alone gives the full column count
+        test_columns = ['Gender', 'Previous_Scores']
+        if os.path.exists(merged_parquet_path):
+            num_columns = len(pq.read_schema(merged_parquet_path).names)
+            df = pd.read_parquet(merged_parquet_path, columns=test_columns, dtype_backend='pyarrow')
+        else:
+            target_path = merged_path if os.path.exists(merged_path) else organized_path
+            num_columns = len(pd.read_csv(target_path, nrows=0).columns)
+            df = pd.read_csv(target_path, engine='pyarrow', dtype_backend='pyarrow', usecols=test_columns,
+                             dtype={'Gender': 'category', 'Previous_Scores': ARROW_INT_DTYPES['Previous_Scores']})
         
         print("Dataset loaded successfully!")
         print(f"   Rows: {len(df):,}")
-        print(f"   Columns: {len(df.columns)}")
+        print(f"   Columns: {num_columns}")
         
         # Test basic operations
         print("\nTesting basic operations...")
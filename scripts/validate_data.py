@@ -1,45 +1,45 @@
 import os
 import sys
-import json
+import orjson
 import pandas as pd
+import pyarrow as pa
 from typing import Dict, Any
+from dataset_dtypes import ARROW_INT_DTYPES, CATEGORY_DTYPES
 
 
 def validate_dataset(df: pd.DataFrame) -> Dict[str, Any]:
     report: Dict[str, Any] = {}
 
     # Shape
-    report['num_rows'] = int(df.shape[0])
-    report['num_columns'] = int(df.shape[1])
+    report['num_rows'] = df.shape[0]
+    report['num_columns'] = df.shape[1]
 
     # Column names and types
     report['columns'] = {col: str(dtype) for col, dtype in df.dtypes.items()}
 
     # Missing values
-    report['missing_per_column'] = df.isna().sum().to_dict()
-    report['missing_total'] = int(df.isna().sum().sum())
+    missing_per_column = df.isna().sum()
+    report['missing_per_column'] = missing_per_column.to_dict()
+    report['missing_total'] = missing_per_column.sum()
 
     # Duplicates
     if 'student_id' in df.columns:
-        report['duplicate_student_id_count'] = int(df.duplicated(subset=['student_id']).sum())
+        report['duplicate_student_id_count'] = df.duplicated(subset=['student_id']).sum()
     else:
-        report['duplicate_rows_count'] = int(df.duplicated().sum())
+        report['duplicate_rows_count'] = df.duplicated().sum()
 
     # Basic numeric ranges/outliers
     numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+    summary_df = df[numeric_cols].agg(['min', 'max', 'mean', 'std']).astype(float)
+    # Simple outlier flags for expected ranges
+    range_cols = [col for col in ['Attendance', 'Previous_Scores'] if col in numeric_cols]
+    range_values = df[range_cols]
+    out_of_range = ((range_values < 0) | (range_values > 100)).sum().to_dict()
     report['numeric_summary'] = {}
     for col in numeric_cols:
-        series = df[col]
-        summary = {
-            'min': float(series.min()) if not series.empty else None,
-            'max': float(series.max()) if not series.empty else None,
-            'mean': float(series.mean()) if not series.empty else None,
-            'std': float(series.std()) if not series.empty else None,
-        }
-        # Simple outlier flags for expected ranges
-        if col in ['Attendance', 'Previous_Scores']:
-            out_of_range = int(((series < 0) | (series > 100)).sum())
-            summary['out_of_range_count'] = out_of_range
+        summary = {stat: None if df.empty else value for stat, value in summary_df[col].to_dict().items()}
+        if col in out_of_range:
+            summary['out_of_range_count'] = out_of_range[col]
         report['numeric_summary'][col] = summary
 
     # Expected columns
@@ -58,29 +58,33 @@ def validate_dataset(df: pd.DataFrame) -> Dict[str, Any]:
 def main():
     base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
     data_dir = os.path.join(base_dir, 'data')
+    parquet_path = os.path.join(data_dir, 'StudentPerformance_with_names.parquet')
     csv_path = os.path.join(data_dir, 'StudentPerformance_with_names.csv')
-    if not os.path.exists(csv_path):
-        print(f"Dataset not found at {csv_path}")
+    if os.path.exists(parquet_path):
+        df = pd.read_parquet(parquet_path, dtype_backend='pyarrow')
+        # Apply the same narrowed dtypes as the CSV branch so the report does not depend on the source file
+        # (Parquet text columns come back as large_string; the CSV reader yields string)
+        dtypes = {col: pd.ArrowDtype(pa.string()) for col, dtype in df.dtypes.items() if str(dtype) == 'large_string[pyarrow]'}
+        dtypes.update({col: dtype for col, dtype in {**CATEGORY_DTYPES, **ARROW_INT_DTYPES}.items() if col in df.columns})
+        df = df.astype(dtypes)
+    elif os.path.exists(csv_path):
+        df = pd.read_csv(csv_path, engine='pyarrow', dtype_backend='pyarrow', dtype={**CATEGORY_DTYPES, **ARROW_INT_DTYPES})
+    else:
+        print(f"Dataset not found at {parquet_path} or {csv_path}")
         sys.exit(1)
 
-    df = pd.read_csv(csv_path)
     # Normalize duplicated header issue if present (e.g., duplicate 'Physical_Activity')
-    df.columns = [c.strip() for c in df.columns]
+    df.columns = df.columns.str.strip()
     # De-duplicate any repeated columns names by keeping the first occurrence
-    seen = set()
-    deduped_columns = []
-    for c in df.columns:
-        if c not in seen:
-            deduped_columns.append(c)
-            seen.add(c)
-    if len(deduped_columns) != len(df.columns):
-        df = df.loc[:, deduped_columns]
+    duplicated = df.columns.duplicated()
+    if duplicated.any():
+        df = df.loc[:, ~duplicated]
 
     report = validate_dataset(df)
     report_path = os.path.join(base_dir, 'reports', 'data_validation_report.json')
     os.makedirs(os.path.dirname(report_path), exist_ok=True)
-    with open(report_path, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2)
+    with open(report_path, 'wb') as f:
+        f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     print(f"Validation report written to {report_path}")
 
 
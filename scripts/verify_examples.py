@@ -1,57 +1,84 @@
 import os
+import sys
+import numpy as np
 import pandas as pd
 
+# The only columns shown in the examples; age is stored as e.g. "18.0", so it stays floating point
+EXAMPLE_DTYPES = {
+    'student_id': 'string',
+    'Gender': 'category',
+    'age': 'float32',
+    'Full_Name': 'string',
+    'Previous_Scores': 'int16',
+    'Attendance': 'int16',
+}
+
 def verify_specific_examples():
     """Show specific examples of cross-referencing"""
     
-    # Read the merged dataset from data directory
+    # Read the merged dataset from data directory, preferring the Parquet copy over re-parsing the CSV
     base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
     data_dir = os.path.join(base_dir, 'data')
-    df = pd.read_csv(os.path.join(data_dir, 'StudentPerformance_with_names.csv'))
+    parquet_path = os.path.join(data_dir, 'StudentPerformance_with_names.parquet')
+    if os.path.exists(parquet_path):
+        df = pd.read_parquet(parquet_path, columns=list(EXAMPLE_DTYPES)).astype(EXAMPLE_DTYPES)
+    else:
+        df = pd.read_csv(os.path.join(data_dir, 'StudentPerformance_with_names.csv'),
+                         usecols=list(EXAMPLE_DTYPES), dtype=EXAMPLE_DTYPES)
+    
+    out = []
+    out.append("=" * 70)
+    out.append("SPECIFIC EXAMPLES OF CROSS-REFERENCING")
+    out.append("=" * 70)
     
-    print("=" * 70)
-    print("SPECIFIC EXAMPLES OF CROSS-REFERENCING")
-    print("=" * 70)
+    out.append("\n📋 FORMAT: Student ID | Gender | Age | Full Name | Performance Data")
+    out.append("-" * 70)
     
-    print("\n📋 FORMAT: Student ID | Gender | Age | Full Name | Performance Data")
-    print("-" * 70)
+    # Extract the six columns once; every section below indexes these same arrays
+    cols = {c: df[c].to_numpy() for c in EXAMPLE_DTYPES}
     
     # Show first 15 examples
-    for i in range(15):
-        row = df.iloc[i]
-        print(f"{row['student_id']:<10} | {row['Gender']:<6} | {row['age']:<3} | {row['Full_Name']:<20} | Score: {row['Previous_Scores']}, Attendance: {row['Attendance']}%")
+    first = slice(0, 15)
+    out.extend(f"{sid:<10} | {gender:<6} | {age:<3} | {name:<20} | Score: {score}, Attendance: {attendance}%"
+               for sid, gender, age, name, score, attendance in zip(
+                   cols['student_id'][first], cols['Gender'][first], cols['age'][first],
+                   cols['Full_Name'][first], cols['Previous_Scores'][first], cols['Attendance'][first]))
     
-    print("\n" + "=" * 70)
-    print("GENDER-BASED NAME VERIFICATION")
-    print("=" * 70)
+    out.append("\n" + "=" * 70)
+    out.append("GENDER-BASED NAME VERIFICATION")
+    out.append("=" * 70)
     
     # Show some male examples
-    male_examples = df[df['Gender'] == 'Male'].head(8)
-    print(f"\n🚹 MALE STUDENTS (Sample of 8):")
-    for _, row in male_examples.iterrows():
-        print(f"   {row['student_id']}: {row['Full_Name']} (Age: {row['age']}, Score: {row['Previous_Scores']})")
+    male_idx = np.flatnonzero(cols['Gender'] == 'Male')[:8]
+    out.append(f"\n🚹 MALE STUDENTS (Sample of 8):")
+    out.extend(f"   {sid}: {name} (Age: {age}, Score: {score})"
+               for sid, name, age, score in zip(cols['student_id'][male_idx], cols['Full_Name'][male_idx],
+                                                cols['age'][male_idx], cols['Previous_Scores'][male_idx]))
     
     # Show some female examples
-    female_examples = df[df['Gender'] == 'Female'].head(8)
-    print(f"\n🚺 FEMALE STUDENTS (Sample of 8):")
-    for _, row in female_examples.iterrows():
-        print(f"   {row['student_id']}: {row['Full_Name']} (Age: {row['age']}, Score: {row['Previous_Scores']})")
+    female_idx = np.flatnonzero(cols['Gender'] == 'Female')[:8]
+    out.append(f"\n🚺 FEMALE STUDENTS (Sample of 8):")
+    out.extend(f"   {sid}: {name} (Age: {age}, Score: {score})"
+               for sid, name, age, score in zip(cols['student_id'][female_idx], cols['Full_Name'][female_idx],
+                                                cols['age'][female_idx], cols['Previous_Scores'][female_idx]))
     
-    print("\n" + "=" * 70)
-    print("RANDOM SAMPLE VERIFICATION")
-    print("=" * 70)
+    out.append("\n" + "=" * 70)
+    out.append("RANDOM SAMPLE VERIFICATION")
+    out.append("=" * 70)
     
     # Show random samples
-    import random
-    random.seed(42)  # For reproducible results
+    rng = np.random.default_rng(42)  # For reproducible results
+    
+    random_idx = rng.choice(len(df), size=min(10, len(df)), replace=False)
+    out.append(f"\n🎲 RANDOM SAMPLE (10 students):")
+    out.extend(f"   {sid}: {name} ({gender}, Age: {age})"
+               for sid, name, gender, age in zip(cols['student_id'][random_idx], cols['Full_Name'][random_idx],
+                                                 cols['Gender'][random_idx], cols['age'][random_idx]))
     
-    random_indices = random.sample(range(len(df)), 10)
-    print(f"\n🎲 RANDOM SAMPLE (10 students):")
-    for idx in random_indices:
-        row = df.iloc[idx]
-        print(f"   {row['student_id']}: {row['Full_Name']} ({row['Gender']}, Age: {row['age']})")
+    out.append("\n" + "=" * 70)
     
-    print("\n" + "=" * 70)
+    # Emit the whole report with a single write
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     verify_specific_examples()